@@ -3,6 +3,8 @@ Configuration settings for X Automation Bot
 Loads environment variables and provides configuration constants
 """
 import os
+import re
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -20,8 +22,51 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 # Bot Settings
 DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
 TIMEZONE = os.getenv("TIMEZONE", "Asia/Kolkata")
-POST_HOUR = int(os.getenv("POST_HOUR", "19"))
-POST_MINUTE = int(os.getenv("POST_MINUTE", "0"))
+
+
+_SCHEDULE_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def _parse_schedule(raw):
+    """Parse "HH:MM=type,..." into (hour, minute, tweet_type, job_id) tuples"""
+    schedule = []
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        time_part, _, tweet_type = item.partition("=")
+        match = _SCHEDULE_TIME_RE.fullmatch(time_part.strip())
+        if not match:
+            raise ValueError(f"Invalid POST_SCHEDULE entry {item!r}: time must be HH:MM")
+        hour, minute = int(match.group(1)), int(match.group(2))
+        if hour > 23 or minute > 59:
+            raise ValueError(f"Invalid POST_SCHEDULE entry {item!r}: time must be between 00:00 and 23:59")
+        tweet_type = tweet_type.strip().lower()
+        if tweet_type not in ("digest", "comment"):
+            raise ValueError(f"Invalid POST_SCHEDULE entry {item!r}: type must be digest or comment")
+        schedule.append((hour, minute, tweet_type, f"post_{hour:02d}{minute:02d}_{tweet_type}"))
+    return schedule
+
+
+# Local scheduler post times (in TIMEZONE) and the tweet type for each
+POST_SCHEDULE = _parse_schedule(
+    os.getenv("POST_SCHEDULE", "03:00=digest,09:00=comment,19:34=digest,21:14=comment")
+)
+# Seconds a missed scheduled post may run late (e.g. after a restart) before it is dropped
+MISFIRE_GRACE_TIME = int(os.getenv("MISFIRE_GRACE_TIME", "3600"))
+# Reuse fetched trending data for this many seconds across runs (0 disables)
+TRENDING_CACHE_TTL = int(os.getenv("TRENDING_CACHE_TTL", "21600"))
+# Offline development: skip credential checks at startup
+SKIP_CREDENTIAL_VALIDATION = os.getenv("SKIP_CREDENTIAL_VALIDATION", "false").lower() in ("1", "true")
+
+
+@lru_cache(maxsize=1)
+def get_timezone():
+    """Resolve TIMEZONE once; the tz database lookup is reused for the process lifetime"""
+    from zoneinfo import ZoneInfo
+
+    return ZoneInfo(TIMEZONE)
+
 
 # RSS Feed Sources for AI and Development News
 RSS_FEEDS = [
@@ -55,8 +100,12 @@ RSS_FEEDS = [
 # Groq Model Configuration
 GROQ_MODEL = "llama-3.1-8b-instant"  # Fast and free
 
+@lru_cache(maxsize=1)
 def validate_config():
-    """Validate that all required configuration is present"""
+    """Validate that all required configuration is present (computed once per process)"""
+    if SKIP_CREDENTIAL_VALIDATION:
+        return ()
+
     errors = []
     
     if not X_API_KEY:
@@ -70,4 +119,4 @@ def validate_config():
     if not GROQ_API_KEY:
         errors.append("GROQ_API_KEY is not set")
     
-    return errors
+    return tuple(errors)
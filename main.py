@@ -4,81 +4,118 @@ X Automation Bot - Main Entry Point
 Generates and posts AI/Development content to X daily at 7PM IST
 """
 
-import argparse
+import atexit
 import logging
+import logging.handlers
+import random
 import signal
 import sys
 from datetime import datetime
+from itertools import islice
+
+# Heavy third-party imports (apscheduler, tweepy, groq, feedparser) are
+# deferred to the functions that need them so `--help` and `--verify` start fast.
+from config.settings import (
+    TIMEZONE,
+    POST_SCHEDULE,
+    MISFIRE_GRACE_TIME,
+    DRY_RUN,
+    SKIP_CREDENTIAL_VALIDATION,
+    get_timezone,
+    validate_config,
+)
+
+# Setup logging
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-import pytz
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
+# delay=True: bot.log isn't opened until the first record is written
+_log_file = logging.handlers.RotatingFileHandler(
+    "bot.log", mode="a", maxBytes=1_000_000, backupCount=3, delay=True
+)
+_log_file.setFormatter(logging.Formatter(LOG_FORMAT))
 
-from config.settings import TIMEZONE, POST_HOUR, POST_MINUTE, DRY_RUN, validate_config
-from modules.news_fetcher import fetch_all_trending
-from modules.content_generator import generate_with_retry, generate_discussion_tweet
-from modules.x_poster import post_tweet, verify_credentials
-from modules.cache_manager import is_duplicate, add_to_cache, get_recent_posts
+# Batch bot.log writes: flushed every 100 records, on ERROR, after each run and at exit
+_log_buffer = logging.handlers.MemoryHandler(
+    capacity=100, flushLevel=logging.ERROR, target=_log_file
+)
+atexit.register(_log_buffer.flush)
 
-# Setup logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("bot.log", mode="a"),
-    ],
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler(sys.stdout), _log_buffer],
 )
 logger = logging.getLogger(__name__)
 
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+
+_BANNER = """
+╔═══════════════════════════════════════════════════════╗
+║           🤖 X Automation Bot                         ║
+║           AI/Development Content Poster               ║
+╚═══════════════════════════════════════════════════════╝
+    """
+
+# Auto mode picks the type scheduled for the current hour (3/19 -> digest, 9/21 -> comment by default)
+_HOUR_TO_TYPE = {hour: tweet_type for hour, _, tweet_type, _ in POST_SCHEDULE}
+
 
-def run_bot(tweet_type: str = "auto"):
+def run_bot(tweet_type: str = "auto", session=None):
     """
     Main bot execution: Fetch trending → Generate tweet → Post to X
 
     Args:
         tweet_type: 'digest', 'comment', or 'auto'
+        session: Optional requests.Session to reuse across runs. If omitted,
+            one is opened for this run and closed when it finishes.
     """
+    from modules.news_fetcher import create_session, fetch_all_trending_cached
+    from modules.content_generator import generate_candidates, generate_discussion_tweet
+    from modules.x_poster import post_tweet
+    from modules.cache_manager import is_duplicate, add_to_cache, get_recent_posts
+
     logger.info("=" * 50)
-    logger.info(f"🤖 X Automation Bot - Starting run (Type: {tweet_type})")
+    logger.info("🤖 X Automation Bot - Starting run (Type: %s)", tweet_type)
 
     # Determine type if auto
     if tweet_type == "auto":
         # Get current hour in IST
-        tz = pytz.timezone(TIMEZONE)
-        current_hour = datetime.now(tz).hour
-
-        # 3 AM & 7 PM (19) -> Digest
-        # 9 AM & 9 PM (21) -> Comment
-        if current_hour in [3, 19]:
-            tweet_type = "digest"
-        elif current_hour in [9, 21]:
-            tweet_type = "comment"
-        else:
-            # Default fallback based on time of day
-            tweet_type = "digest" if current_hour < 12 else "comment"
+        current_hour = datetime.now(get_timezone()).hour
 
-    logger.info(f"   Using mode: {tweet_type.upper()}")
+        # Scheduled hour -> its type, otherwise fall back based on time of day
+        tweet_type = _HOUR_TO_TYPE.get(current_hour) or (
+            "digest" if current_hour < 12 else "comment"
+        )
+
+    logger.info("   Using mode: %s", tweet_type.upper())
     logger.info("=" * 50)
 
+    owns_session = session is None
+    if owns_session:
+        session = create_session()
+
     try:
         # Step 1: Fetch trending discussions
         logger.info("🔥 Step 1: Fetching trending dev discussions...")
-        trending = fetch_all_trending()
+        trending = fetch_all_trending_cached(session=session)
 
         hn_count = len(trending.get("hn_discussions", []))
         gh_count = len(trending.get("github_repos", []))
         news_count = len(trending.get("news", []))
 
         logger.info(
-            f"   Found: {hn_count} HN discussions, {gh_count} GitHub repos, {news_count} news"
+            "   Found: %d HN discussions, %d GitHub repos, %d news",
+            hn_count,
+            gh_count,
+            news_count,
         )
 
         # Log top discussions
-        for d in trending.get("hn_discussions", [])[:3]:
-            logger.info(f"   📢 HN: {d['title'][:50]}... ({d['points']} pts)")
-        for r in trending.get("github_repos", [])[:2]:
-            logger.info(f"   ⭐ GH: {r['title'][:50]}... ({r['stars']} stars)")
+        if logger.isEnabledFor(logging.INFO):
+            for d in islice(trending.get("hn_discussions") or (), 3):
+                logger.info("   📢 HN: %.50s... (%s pts)", d.title, d.points)
+            for r in islice(trending.get("github_repos") or (), 2):
+                logger.info("   ⭐ GH: %.50s... (%s stars)", r.title, r.stars)
 
         # Step 2: Generate authentic tweet (with retry if duplicate)
         logger.info("\n🤖 Step 2: Generating tweet with AI...")
@@ -86,54 +123,75 @@ def run_bot(tweet_type: str = "auto"):
         # Get recent posts for context
         recent_posts = get_recent_posts(limit=10)
         logger.info(
-            f"   Context: Using last {len(recent_posts)} posts to avoid repetition"
+            "   Context: Using last %d posts to avoid repetition", len(recent_posts)
         )
 
         max_attempts = 5
         tweet = None
+        result = None
+        # Digest candidates come from one batched LLM call instead of one call per attempt
+        digest_candidates = []
+
+        if tweet_type == "comment":
+            # Top discussions to comment on; trending doesn't change between attempts
+            topic_pools = [
+                pool
+                for pool in (
+                    trending.get("hn_discussions", [])[:3],
+                    trending.get("github_repos", [])[:2],
+                )
+                if pool
+            ]
+            if not topic_pools:
+                logger.warning("   No specific topics found, falling back to digest")
+                tweet_type = "digest"
 
         for attempt in range(max_attempts):
             if tweet_type == "comment":
-                # Pick a random top discussion to comment on
-                import random
-
-                sources = []
-                if trending.get("hn_discussions"):
-                    sources.append(random.choice(trending["hn_discussions"][:3]))
-                if trending.get("github_repos"):
-                    sources.append(random.choice(trending["github_repos"][:2]))
-
-                if sources:
-                    chosen_topic = random.choice(sources)
-                    logger.info(f"   Selected topic: {chosen_topic.get('title')}")
-                    tweet = generate_discussion_tweet(chosen_topic)
-                else:
-                    logger.warning(
-                        "   No specific topics found, falling back to digest"
-                    )
-                    tweet = generate_with_retry(trending, recent_posts=recent_posts)
+                # Pick a random source, then a random top discussion from it
+                chosen_topic = random.choice(random.choice(topic_pools))
+                logger.info("   Selected topic: %s", chosen_topic.title)
+                tweet = generate_discussion_tweet(chosen_topic)
             else:
-                # Default digest mode
-                tweet = generate_with_retry(trending, recent_posts=recent_posts)
+                if not digest_candidates:
+                    digest_candidates = generate_candidates(
+                        trending,
+                        recent_posts=recent_posts,
+                        n=max_attempts - attempt,
+                    )
+                tweet = digest_candidates.pop(0)
 
-            logger.info(f"   Generated ({len(tweet)} chars): {tweet}")
+            logger.info("   Generated (%d chars): %s", len(tweet), tweet)
 
             # Check if duplicate
             if is_duplicate(tweet):
                 logger.warning(
-                    f"   ⚠️ Duplicate detected (attempt {attempt + 1}/{max_attempts}), regenerating..."
+                    "   ⚠️ Duplicate detected (attempt %d/%d), regenerating...",
+                    attempt + 1,
+                    max_attempts,
                 )
                 continue
-            else:
-                logger.info("   ✅ Unique content, proceeding to post")
-                break
 
-        if tweet is None or is_duplicate(tweet):
-            raise RuntimeError("Failed to generate unique content after all attempts")
+            logger.info("   ✅ Unique content, proceeding to post")
+
+            # Step 3: Post to X
+            logger.info("\n📤 Step 3: Posting to X...")
+            result = post_tweet(tweet)
 
-        # Step 3: Post to X
-        logger.info("\n📤 Step 3: Posting to X...")
-        result = post_tweet(tweet)
+            # The poster also rejects anything it ever posted (beyond the
+            # cache's window), so a tweet unique here can still be refused
+            if result.get("duplicate"):
+                logger.warning(
+                    "   ⚠️ Rejected as duplicate (attempt %d/%d), regenerating...",
+                    attempt + 1,
+                    max_attempts,
+                )
+                result = None
+                continue
+            break
+
+        if result is None:
+            raise RuntimeError("Failed to generate unique content after all attempts")
 
         # Step 4: Save to cache if successful
         if not result.get("dry_run"):
@@ -144,109 +202,162 @@ def run_bot(tweet_type: str = "auto"):
         if result.get("dry_run"):
             logger.info("   [DRY RUN] Tweet was not actually posted")
         else:
-            logger.info(f"   ✅ Posted! View at: {result.get('url')}")
+            logger.info("   ✅ Posted! View at: %s", result.get("url"))
 
-        logger.info("\n" + "=" * 50)
+        logger.info("\n%s", "=" * 50)
         logger.info("✅ Bot run completed successfully!")
         logger.info("=" * 50)
 
         return result
 
     except Exception as e:
-        logger.error(f"❌ Bot run failed: {e}")
+        logger.error("❌ Bot run failed: %s", e)
         raise
 
+    finally:
+        if owns_session:
+            session.close()
+        _log_buffer.flush()
+
+
+def _prewarm(session):
+    """
+    Best-effort warm-up so the first scheduled run isn't slower than the rest.
+
+    Imports the generation/posting modules and does a throwaway trending fetch
+    to populate DNS, the session's connection pool and bytecode caches. The
+    fetch bypasses the trending cache: it must hit the network to warm
+    anything, and must not leave data behind for the first scheduled run.
+    Failures are logged and ignored.
+    """
+    try:
+        from modules.news_fetcher import fetch_all_trending
+        import modules.cache_manager  # noqa: F401
+        import modules.content_generator  # noqa: F401
+        import modules.x_poster  # noqa: F401
+        import tweepy  # noqa: F401  (x_poster imports it lazily)
+
+        fetch_all_trending(session=session)
+        logger.info("   🔥 Pre-warm complete")
+    except Exception as e:
+        logger.warning("   Pre-warm failed (ignored): %s", e)
+
 
 def start_scheduler():
     """
     Start the APScheduler to run the bot daily at configured time.
+
+    Jobs run on an asyncio event loop; run_bot itself is synchronous, so the
+    scheduler's executor hands it to the loop's thread pool and the loop stays
+    free to fire (or coalesce) other jobs while network I/O is in flight.
     """
+    import asyncio
+
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from apscheduler.triggers.cron import CronTrigger
+
+    from modules.news_fetcher import create_session
+    from modules.x_poster import verify_credentials
+
     # Validate configuration
     errors = validate_config()
     if errors:
         logger.error("Configuration errors:")
         for error in errors:
-            logger.error(f"  • {error}")
+            logger.error("  • %s", error)
         sys.exit(1)
 
     # Verify X credentials
-    logger.info("🔐 Verifying X API credentials...")
-    try:
-        user = verify_credentials()
-        logger.info(f"   Authenticated as @{user['username']}")
-    except Exception as e:
-        logger.error(f"Failed to verify credentials: {e}")
-        sys.exit(1)
+    if SKIP_CREDENTIAL_VALIDATION:
+        logger.warning("🔐 SKIP_CREDENTIAL_VALIDATION set, not verifying X API credentials")
+    else:
+        logger.info("🔐 Verifying X API credentials...")
+        try:
+            user = verify_credentials()
+            logger.info("   Authenticated as @%s", user["username"])
+        except Exception as e:
+            logger.error("Failed to verify credentials: %s", e)
+            sys.exit(1)
 
     # Setup scheduler
-    tz = pytz.timezone(TIMEZONE)
-    scheduler = BlockingScheduler(timezone=tz)
-
-    # Add jobs for 4x daily schedule
-    # 03:00 AM - Digest
-    scheduler.add_job(
-        run_bot,
-        CronTrigger(hour=3, minute=0, timezone=tz),
-        id="post_morning_digest",
-        kwargs={"tweet_type": "digest"},
+    tz = get_timezone()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    # After a restart, missed posts collapse into a single run (coalesce) and are
+    # dropped once they're more than MISFIRE_GRACE_TIME late, so a restart never
+    # fires a burst of jobs at the Groq/X APIs
+    scheduler = AsyncIOScheduler(
+        timezone=tz,
+        event_loop=loop,
+        job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": MISFIRE_GRACE_TIME,
+        },
     )
 
-    # 09:00 AM - Comment
-    scheduler.add_job(
-        run_bot,
-        CronTrigger(hour=9, minute=0, timezone=tz),
-        id="post_morning_comment",
-        kwargs={"tweet_type": "comment"},
-    )
-
-    # 07:34 PM - Digest
-    scheduler.add_job(
-        run_bot,
-        CronTrigger(hour=19, minute=34, timezone=tz),
-        id="post_evening_digest",
-        kwargs={"tweet_type": "digest"},
-    )
-
-    # 09:14 PM - Comment
-    scheduler.add_job(
-        run_bot,
-        CronTrigger(hour=21, minute=14, timezone=tz),
-        id="post_night_comment",
-        kwargs={"tweet_type": "comment"},
-    )
+    # One HTTP session for the lifetime of the scheduler so DNS lookups,
+    # keep-alive connections and TLS sessions carry over between runs
+    session = create_session()
+
+    # Add one job per configured post time
+    for hour, minute, tweet_type, job_id in POST_SCHEDULE:
+        scheduler.add_job(
+            run_bot,
+            CronTrigger(hour=hour, minute=minute, timezone=tz),
+            id=job_id,
+            kwargs={"tweet_type": tweet_type, "session": session},
+        )
 
     # Log configuration
-    now = datetime.now(tz)
+    now_str = datetime.now(tz).strftime(TIME_FORMAT)
     logger.info("\n📅 Scheduler configured:")
-    logger.info(f"   Timezone: {TIMEZONE}")
-    logger.info(f"   Post times: 03:00 (D), 09:00 (C), 19:34 (D), 21:14 (C)")
-    logger.info(f"   Current time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
-
-    # Print next runs
-    for job in scheduler.get_jobs():
-        logger.info(
-            f"   Next run ({job.id}): {job.next_run_time.strftime('%Y-%m-%d %H:%M:%S %Z')}"
-        )
-
-    logger.info(f"   Dry run mode: {DRY_RUN}")
+    logger.info("   Timezone: %s", TIMEZONE)
+    post_times = ", ".join(
+        f"{hour:02d}:{minute:02d} ({tweet_type[0].upper()})"
+        for hour, minute, tweet_type, _ in POST_SCHEDULE
+    )
+    logger.info("   Post times: %s", post_times)
+    logger.info("   Current time: %s", now_str)
+    logger.info("   Dry run mode: %s", DRY_RUN)
 
     # Graceful shutdown
     def shutdown(signum, frame):
         logger.info("\n👋 Shutting down scheduler...")
         scheduler.shutdown(wait=False)
-        sys.exit(0)
+        loop.call_soon_threadsafe(loop.stop)
 
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
-    logger.info("\n🚀 Scheduler started! Press Ctrl+C to stop.\n")
     scheduler.start()
 
+    # Next run times are only computed once the scheduler is running
+    for job in scheduler.get_jobs():
+        logger.info(
+            "   Next run (%s): %s",
+            job.id,
+            job.next_run_time.strftime(TIME_FORMAT),
+        )
+
+    logger.info("\n🚀 Scheduler started! Press Ctrl+C to stop.\n")
 
-def main():
+    # Off the loop thread so scheduling is never held up by the warm-up
+    loop.run_in_executor(None, _prewarm, session)
+
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+        session.close()
+
+
+def _parse_args():
     """
-    Main entry point with argument parsing.
+    Build the CLI parser and parse sys.argv.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="X Automation Bot - AI/Dev content poster",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -272,17 +383,25 @@ Examples:
         "--verify", action="store_true", help="Verify credentials and exit"
     )
 
-    args = parser.parse_args()
+    return parser.parse_args()
 
-    print("""
-╔═══════════════════════════════════════════════════════╗
-║           🤖 X Automation Bot                         ║
-║           AI/Development Content Poster               ║
-╚═══════════════════════════════════════════════════════╝
-    """)
 
-    if args.verify:
+def main():
+    """
+    Main entry point with argument parsing.
+    """
+    # Plain `python main.py` (the scheduler) is the common case; skip argparse for it
+    args = _parse_args() if len(sys.argv) > 1 else None
+
+    print(_BANNER)
+
+    if args is None:
+        start_scheduler()
+
+    elif args.verify:
         # Just verify credentials
+        from modules.x_poster import verify_credentials
+
         errors = validate_config()
         if errors:
             print("❌ Configuration errors:")
@@ -303,7 +422,7 @@ Examples:
         if errors:
             logger.error("Configuration errors:")
             for error in errors:
-                logger.error(f"  • {error}")
+                logger.error("  • %s", error)
             sys.exit(1)
 
         run_bot(tweet_type=args.type)
@@ -1,7 +1,7 @@
 # Modules package
-from .news_fetcher import fetch_all_trending, get_headlines
-from .content_generator import generate_tweet, generate_with_retry
-from .x_poster import post_tweet
+# Public names are resolved lazily (PEP 562) so importing one submodule
+# doesn't drag in feedparser, groq and tweepy all at once.
+from importlib import import_module
 
 __all__ = [
     "fetch_all_trending",
@@ -10,3 +10,24 @@ __all__ = [
     "generate_with_retry",
     "post_tweet",
 ]
+
+_LAZY = {
+    "fetch_all_trending": ".news_fetcher",
+    "get_headlines": ".news_fetcher",
+    "generate_tweet": ".content_generator",
+    "generate_with_retry": ".content_generator",
+    "post_tweet": ".x_poster",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        # Cache on the package so later lookups skip __getattr__ entirely
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,8 +3,12 @@ Content Generator Module
 Uses Groq AI to generate authentic, conversational tweets based on trending dev discussions
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict
+import re
+from collections import OrderedDict
+from typing import Dict, List
 from groq import Groq
 
 from config.settings import GROQ_API_KEY, GROQ_MODEL
@@ -13,6 +17,8 @@ logger = logging.getLogger(__name__)
 
 # Authentic tweet generation - sounds like a real dev, not a bot
 
+TWEET_SYSTEM_PROMPT = "You are a tech-savvy developer who shares interesting finds on X. You sound authentic, not corporate. Short, punchy tweets."
+
 TWEET_PROMPT = """You are a senior developer who has seen it all. You are tired of the hype cycle.
 You are posting on X (Twitter).
 
@@ -23,7 +29,7 @@ YOUR RECENT POSTS (Don't repeat these):
 {recent_posts_context}
 
 TASK:
-Write ONE tweet about something from the context.
+{task}
 
 PERSONA RULES:
 1. Speak in lowercase. It's more authentic.
@@ -45,7 +51,23 @@ GOOD EXAMPLES (Human behavior):
 - "tried the new cursor update. honestly? not bad."
 - "i give this new framework 6 months before google kills it"
 
-Output ONLY the tweet text. No quotes."""
+{output_rule}"""
+
+SINGLE_TWEET_TASK = "Write ONE tweet about something from the context."
+SINGLE_TWEET_OUTPUT = "Output ONLY the tweet text. No quotes."
+
+CANDIDATES_TASK = """Write {n} DIFFERENT tweets about things from the context.
+Each one should pick a different topic or angle."""
+CANDIDATES_OUTPUT = """Output ONLY a JSON array of {n} strings, one tweet each, like:
+["first tweet", "second tweet"]
+No other text before or after the array."""
+
+# Leading list markers the model sometimes adds despite instructions ("1.", "2)", "-", "•")
+_LIST_MARKER_RE = re.compile(r"^\s*(?:\d+[.)]|[-•*])\s*")
+# Preamble lines a plain-text reply may open with ("here are 5 different tweets:")
+_PREAMBLE_RE = re.compile(
+    r"^(?:here(?:'s| is| are)\b|sure\b)|\b\d+ (?:different )?tweets\b|:$", re.IGNORECASE
+)
 
 
 COMMENT_TWEET_PROMPT = """You're a dev reading this trending news:
@@ -70,50 +92,110 @@ Examples:
 Output JUST the tweet text:"""
 
 
-def generate_tweet(trending_data: Dict, recent_posts: list = None) -> str:
-    """
-    Generate an authentic tweet based on trending dev discussions.
+_CLIENT = None
 
-    Args:
-        trending_data: Dict with hn_discussions, github_repos, news from fetch_all_trending()
-        recent_posts: Optional list of recently posted tweets for context
+# generate_tweet results keyed by (prompt digest, temperature), most recent last.
+# Only that path is cached: candidate/discussion generation is called again
+# precisely to get a different tweet, so caching it would defeat the retry.
+_TWEET_CACHE = OrderedDict()
+TWEET_CACHE_SIZE = 64
 
-    Returns:
-        Generated tweet text (under 280 characters)
-    """
-    if not GROQ_API_KEY:
-        raise ValueError("GROQ_API_KEY is not configured")
 
-    # Build context from trending data
-    context_parts = []
+def _client() -> Groq:
+    """Return the shared Groq client, so retries reuse its HTTP connection pool."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = Groq(api_key=GROQ_API_KEY)
+    return _CLIENT
+
+
+def _clean_tweet(text: str) -> str:
+    """Strip whitespace and wrapping quotes, then trim to fit in 280 chars."""
+    tweet = text.strip().strip('"').strip("'")
+
+    # Ensure under 280 chars
+    if len(tweet) > 280:
+        tweet = tweet[:277].rsplit(" ", 1)[0] + "..."
+
+    return tweet
+
+
+def _fmt(trending_data: Dict):
+    """Yield the context lines for TWEET_PROMPT, one per trending item."""
+    hn = trending_data.get("hn_discussions", ())
+    gh = trending_data.get("github_repos", ())
+    news = trending_data.get("news", ())
 
     # Add HN discussions (most important - real dev conversations)
-    hn = trending_data.get("hn_discussions", [])
     if hn:
-        context_parts.append("🔥 HOT ON HACKER NEWS:")
+        yield "🔥 HOT ON HACKER NEWS:"
         for d in hn[:3]:
-            context_parts.append(
-                f'  • "{d["title"]}" ({d["points"]} upvotes, {d["comments"]} comments)'
-            )
+            yield f'  • "{d.title}" ({d.points} upvotes, {d.comments} comments)'
 
     # Add GitHub trending
-    gh = trending_data.get("github_repos", [])
     if gh:
-        context_parts.append("\n⭐ TRENDING ON GITHUB:")
+        yield "\n⭐ TRENDING ON GITHUB:"
         for r in gh[:2]:
-            context_parts.append(f"  • {r['title']} ({r['stars']} stars)")
+            yield f"  • {r.title} ({r.stars} stars)"
 
     # Add news
-    news = trending_data.get("news", [])
     if news:
-        context_parts.append("\n📰 LATEST NEWS:")
+        yield "\n📰 LATEST NEWS:"
         for n in news[:2]:
-            context_parts.append(f"  • {n['title']}")
+            yield f"  • {n['title']}"
 
-    if not context_parts:
-        context_parts = ["AI and coding tools continue to evolve rapidly"]
 
-    context = "\n".join(context_parts)
+def _parse_candidates(content: str) -> List[str]:
+    """
+    Split a batched reply into tweet texts.
+
+    Args:
+        content: Raw model reply, ideally a JSON array of strings
+
+    Returns:
+        Tweet texts with list markers and preamble lines removed (not yet cleaned)
+    """
+    start, end = content.find("["), content.rfind("]")
+    items = None
+    if start != -1 and end > start:
+        try:
+            items = json.loads(content[start : end + 1])
+        except ValueError:
+            pass
+
+    if isinstance(items, list):
+        lines = [item for item in items if isinstance(item, str)]
+    else:
+        # Not a JSON array: fall back to one tweet per line
+        logger.warning("Batched response wasn't a JSON array, splitting lines")
+        lines = content.splitlines()
+
+    texts = []
+    for line in lines:
+        text = _LIST_MARKER_RE.sub("", line).strip()
+        if text and not _PREAMBLE_RE.search(text):
+            texts.append(text)
+    return texts
+
+
+def _build_prompt(
+    trending_data: Dict, recent_posts: list, task: str, output_rule: str
+) -> str:
+    """
+    Render TWEET_PROMPT from trending data and recent posts.
+
+    Args:
+        trending_data: Dict with hn_discussions, github_repos, news from fetch_all_trending()
+        recent_posts: Optional list of recently posted tweets for context
+        task: TASK section of the prompt
+        output_rule: Output instruction closing the prompt
+
+    Returns:
+        Prompt text ready to send to the model
+    """
+    context = "\n".join(_fmt(trending_data)) or (
+        "AI and coding tools continue to evolve rapidly"
+    )
 
     # Build recent posts context
     recent_posts_context = ""
@@ -124,34 +206,61 @@ def generate_tweet(trending_data: Dict, recent_posts: list = None) -> str:
         for i, post in enumerate(recent_posts[:10], 1):
             recent_posts_context += f"  {i}. {post}\n"
 
-    prompt = TWEET_PROMPT.format(
-        context=context, recent_posts_context=recent_posts_context
+    return TWEET_PROMPT.format(
+        context=context,
+        recent_posts_context=recent_posts_context,
+        task=task,
+        output_rule=output_rule,
     )
 
+
+def _call_groq(prompt: str, use_cache: bool = True) -> str:
+    """
+    Generate one tweet from an already rendered TWEET_PROMPT.
+
+    Args:
+        prompt: Output of _build_prompt()
+        use_cache: Reuse a tweet generated for the same prompt; retries pass
+            False to get a fresh reply
+
+    Returns:
+        Generated tweet text (under 280 characters)
+    """
+    temperature = 0.9  # More creative/varied
+
+    # Same trending data and history renders the same prompt; skip the API call
+    cache_key = (
+        hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest(),
+        temperature,
+    )
+    if use_cache and cache_key in _TWEET_CACHE:
+        _TWEET_CACHE.move_to_end(cache_key)
+        logger.info("Reusing tweet generated for an identical prompt")
+        return _TWEET_CACHE[cache_key]
+
     try:
-        client = Groq(api_key=GROQ_API_KEY)
+        client = _client()
 
         response = client.chat.completions.create(
             model=GROQ_MODEL,
             messages=[
-                {
-                    "role": "system",
-                    "content": "You are a tech-savvy developer who shares interesting finds on X. You sound authentic, not corporate. Short, punchy tweets.",
-                },
+                {"role": "system", "content": TWEET_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
             max_tokens=100,
-            temperature=0.9,  # More creative/varied
+            temperature=temperature,
         )
 
-        tweet = response.choices[0].message.content.strip()
-        tweet = tweet.strip('"').strip("'")
-
-        # Ensure under 280 chars
-        if len(tweet) > 280:
-            tweet = tweet[:277].rsplit(" ", 1)[0] + "..."
+        tweet = _clean_tweet(response.choices[0].message.content)
 
         logger.info(f"Generated tweet ({len(tweet)} chars): {tweet}")
+
+        # Unusable replies aren't cached, so a retry asks again
+        if tweet and len(tweet) <= 280:
+            _TWEET_CACHE[cache_key] = tweet
+            _TWEET_CACHE.move_to_end(cache_key)
+            if len(_TWEET_CACHE) > TWEET_CACHE_SIZE:
+                _TWEET_CACHE.popitem(last=False)
         return tweet
 
     except Exception as e:
@@ -159,13 +268,98 @@ def generate_tweet(trending_data: Dict, recent_posts: list = None) -> str:
         raise
 
 
-def generate_discussion_tweet(discussion: Dict) -> str:
+def generate_tweet(trending_data: Dict, recent_posts: list = None) -> str:
+    """
+    Generate an authentic tweet based on trending dev discussions.
+
+    Args:
+        trending_data: Dict with hn_discussions, github_repos, news from fetch_all_trending()
+        recent_posts: Optional list of recently posted tweets for context
+
+    Returns:
+        Generated tweet text (under 280 characters)
+    """
+    if not GROQ_API_KEY:
+        raise ValueError("GROQ_API_KEY is not configured")
+
+    prompt = _build_prompt(
+        trending_data, recent_posts, SINGLE_TWEET_TASK, SINGLE_TWEET_OUTPUT
+    )
+    return _call_groq(prompt)
+
+
+def generate_candidates(
+    trending_data: Dict, recent_posts: list = None, n: int = 5, max_retries: int = 3
+) -> List[str]:
+    """
+    Generate several distinct tweet candidates in a single Groq call.
+
+    Callers that need a non-duplicate tweet can walk the list locally instead
+    of paying one API round-trip per attempt.
+
+    Args:
+        trending_data: Trending content dict
+        recent_posts: Optional list of recent posts for context
+        n: Number of candidates to ask for
+        max_retries: Maximum attempts at the batched API call
+
+    Returns:
+        Non-empty list of tweet texts (under 280 characters each)
+    """
+    if not GROQ_API_KEY:
+        raise ValueError("GROQ_API_KEY is not configured")
+
+    prompt = _build_prompt(
+        trending_data,
+        recent_posts,
+        CANDIDATES_TASK.format(n=n),
+        CANDIDATES_OUTPUT.format(n=n),
+    )
+
+    # Retried like generate_with_retry(): one transient API error shouldn't
+    # fail the scheduled post
+    for attempt in range(max_retries):
+        try:
+            client = _client()
+
+            response = client.chat.completions.create(
+                model=GROQ_MODEL,
+                messages=[
+                    {"role": "system", "content": TWEET_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=100 * n,
+                temperature=0.9,
+            )
+            break
+
+        except Exception as e:
+            logger.warning(f"Candidates attempt {attempt + 1} failed: {e}")
+            if attempt == max_retries - 1:
+                logger.error(f"Error generating tweet candidates: {e}")
+                raise
+
+    candidates = []
+    for text in _parse_candidates(response.choices[0].message.content):
+        tweet = _clean_tweet(text)
+        if tweet and tweet not in candidates:
+            candidates.append(tweet)
+
+    if not candidates:
+        logger.warning("No usable candidates in batched response, generating one")
+        candidates = [generate_with_retry(trending_data, recent_posts)]
+
+    logger.info(f"Generated {len(candidates)} tweet candidates")
+    return candidates
+
+
+def generate_discussion_tweet(discussion) -> str:
     """
     Generate a tweet commenting on a specific trending discussion.
     More focused than general tweet.
 
     Args:
-        discussion: Single HN discussion or GitHub repo dict
+        discussion: Single HNDiscussion or GitHubRepo
 
     Returns:
         Generated tweet
@@ -173,24 +367,24 @@ def generate_discussion_tweet(discussion: Dict) -> str:
     if not GROQ_API_KEY:
         raise ValueError("GROQ_API_KEY is not configured")
 
-    topic = discussion.get("title", "")
-    source = discussion.get("source", "dev community")
+    topic = discussion.title
+    source = discussion.source or "dev community"
 
     # Build context
     context_parts = []
-    if "points" in discussion:
+    if hasattr(discussion, "points"):
         context_parts.append(
-            f"{discussion['points']} upvotes, {discussion.get('comments', 0)} comments"
+            f"{discussion.points} upvotes, {discussion.comments} comments"
         )
-    if "stars" in discussion:
-        context_parts.append(f"{discussion['stars']} GitHub stars")
+    if hasattr(discussion, "stars"):
+        context_parts.append(f"{discussion.stars} GitHub stars")
 
     context = ", ".join(context_parts) if context_parts else "trending now"
 
     prompt = COMMENT_TWEET_PROMPT.format(topic=topic, source=source, context=context)
 
     try:
-        client = Groq(api_key=GROQ_API_KEY)
+        client = _client()
 
         response = client.chat.completions.create(
             model=GROQ_MODEL,
@@ -205,13 +399,7 @@ def generate_discussion_tweet(discussion: Dict) -> str:
             temperature=0.9,
         )
 
-        tweet = response.choices[0].message.content.strip()
-        tweet = tweet.strip('"').strip("'")
-
-        if len(tweet) > 280:
-            tweet = tweet[:277].rsplit(" ", 1)[0] + "..."
-
-        return tweet
+        return _clean_tweet(response.choices[0].message.content)
 
     except Exception as e:
         logger.error(f"Error generating discussion tweet: {e}")
@@ -224,6 +412,8 @@ def generate_with_retry(
     """
     Generate tweet with retry logic.
 
+    The prompt is rendered once; only the API call is retried.
+
     Args:
         trending_data: Trending content dict
         recent_posts: Optional list of recent posts for context
@@ -232,9 +422,17 @@ def generate_with_retry(
     Returns:
         Generated tweet text
     """
+    if not GROQ_API_KEY:
+        raise ValueError("GROQ_API_KEY is not configured")
+
+    prompt = _build_prompt(
+        trending_data, recent_posts, SINGLE_TWEET_TASK, SINGLE_TWEET_OUTPUT
+    )
+
     for attempt in range(max_retries):
         try:
-            tweet = generate_tweet(trending_data, recent_posts)
+            # Only the first attempt may reuse a cached tweet
+            tweet = _call_groq(prompt, use_cache=attempt == 0)
             if tweet and len(tweet) <= 280:
                 return tweet
         except Exception as e:
@@ -249,28 +447,38 @@ if __name__ == "__main__":
     # Test the content generator
     logging.basicConfig(level=logging.INFO)
 
+    from modules.news_fetcher import GitHubRepo, HNDiscussion
+
     # Mock trending data for testing
     test_data = {
         "hn_discussions": [
-            {
-                "title": "Show HN: I built an AI that writes code better than me",
-                "points": 342,
-                "comments": 156,
-                "source": "Hacker News",
-            },
-            {
-                "title": "Why I'm mass quitting AI tools after a year",
-                "points": 234,
-                "comments": 89,
-                "source": "Hacker News",
-            },
+            HNDiscussion(
+                id="1",
+                title="Show HN: I built an AI that writes code better than me",
+                url="https://news.ycombinator.com/item?id=1",
+                points=342,
+                comments=156,
+                author="",
+                hn_link="https://news.ycombinator.com/item?id=1",
+            ),
+            HNDiscussion(
+                id="2",
+                title="Why I'm mass quitting AI tools after a year",
+                url="https://news.ycombinator.com/item?id=2",
+                points=234,
+                comments=89,
+                author="",
+                hn_link="https://news.ycombinator.com/item?id=2",
+            ),
         ],
         "github_repos": [
-            {
-                "title": "cursor-ai-clone - Open source AI coding assistant",
-                "stars": 1200,
-                "source": "GitHub Trending",
-            }
+            GitHubRepo(
+                title="cursor-ai-clone - Open source AI coding assistant",
+                url="https://github.com/example/cursor-ai-clone",
+                stars=1200,
+                language="Python",
+                author="example",
+            )
         ],
         "news": [
             {"title": "OpenAI releases GPT-5 with revolutionary reasoning capabilities"}
@@ -0,0 +1,139 @@
+"""
+JSONL Log Module
+Append-only JSON Lines files shared by the posted-content cache and the
+tweet history: tail loading, appends, atomic compaction and legacy migration
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Tuple
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps  # Compact output, already bytes
+except ImportError:  # orjson is optional; fall back to the stdlib
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(records: Iterable) -> bytes:
+    return b"".join(_dumps(record) + b"\n" for record in records)
+
+
+def read_tail(path: Path, max_entries: Optional[int]) -> Tuple[deque, int]:
+    """
+    Read the last max_entries records of a log.
+
+    Args:
+        path: Log file
+        max_entries: Number of trailing records to keep (None keeps all)
+
+    Returns:
+        (records deque bounded to max_entries, total line count)
+
+    Raises:
+        OSError: If the file can't be read (incl. FileNotFoundError)
+    """
+    line_count = 0
+    tail = deque(maxlen=max_entries)
+    with open(path, "rb") as f:
+        for line in f:
+            line_count += 1
+            tail.append(line)
+
+    records = deque(maxlen=max_entries)
+    for line in tail:
+        if not line.strip():
+            continue
+        try:
+            records.append(_loads(line))
+        except ValueError:
+            # A torn final line from an interrupted append
+            logger.warning(f"Skipping unreadable line in {path.name}")
+
+    return records, line_count
+
+
+def append(path: Path, records: Iterable) -> int:
+    """
+    Append records to a log in one write.
+
+    Returns:
+        Number of lines appended
+    """
+    data = _encode(records)
+    with open(path, "ab") as f:
+        f.write(data)
+    return data.count(b"\n")
+
+
+def rewrite(path: Path, records: Iterable) -> int:
+    """
+    Replace a log with records (compaction).
+
+    A sibling file is written and swapped in, so a crash can't truncate the log.
+
+    Returns:
+        Number of lines written
+    """
+    data = _encode(records)
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+    return data.count(b"\n")
+
+
+def needs_compaction(line_count: int, max_entries: int) -> bool:
+    """Logs are compacted once they reach twice the entries they keep."""
+    return line_count > 2 * max_entries
+
+
+def migrate_legacy(
+    legacy_path: Path, path: Path, extract: Callable, sort_key: Callable = None
+) -> bool:
+    """
+    Convert a pre-JSONL JSON document into a log and remove it.
+
+    If the log already exists (e.g. a checked-out or restored copy sits
+    beside the legacy file), both are merged rather than the legacy records
+    being ignored.
+
+    Args:
+        legacy_path: Old JSON file
+        path: Log file to create or merge into
+        extract: Returns the records from the parsed legacy document
+        sort_key: Orders the merged records (oldest first); without it the
+            legacy records go before the log's
+
+    Returns:
+        True if the log was written and the legacy file removed
+    """
+    try:
+        records = list(extract(_loads(legacy_path.read_bytes())))
+    except Exception as e:
+        logger.warning(f"Error reading {legacy_path.name}: {e}, not migrating")
+        return False
+
+    try:
+        if path.exists():
+            records.extend(read_tail(path, None)[0])
+        if sort_key is not None:
+            records.sort(key=sort_key)
+        rewrite(path, records)
+    except OSError as e:
+        logger.error(f"Error migrating {legacy_path.name}: {e}")
+        return False
+
+    legacy_path.unlink()
+    logger.info(f"📦 Migrated {len(records)} entries to {path.name}")
+    return True
@@ -5,12 +5,20 @@ Fetches trending AI/Development discussions from Hacker News, GitHub, and RSS fe
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict
+import json
 import logging
+import os
 import re
+import threading
+import time
 
-from config.settings import RSS_FEEDS
+from config.settings import RSS_FEEDS, TRENDING_CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
@@ -20,80 +28,249 @@ HN_ALGOLIA_URL = "https://hn.algolia.com/api/v1/search"
 # GitHub trending (via search API - no auth needed for basic search)
 GITHUB_SEARCH_URL = "https://api.github.com/search/repositories"
 
+# HTML tags in RSS summaries
+_TAG_RE = re.compile(r"<[^>]+>")
 
-def fetch_hn_trending(min_points: int = 50, max_items: int = 5) -> List[Dict]:
+# Pooled connections per host; HN runs one search per query concurrently
+HTTP_POOL_SIZE = 10
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests.Session with keep-alive pools sized for the fetchers.
+
+    Returns:
+        Session with HTTPAdapters mounted for the HN and GitHub APIs
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://hn.algolia.com", adapter)
+    session.mount("https://api.github.com", adapter)
+    return session
+
+
+@dataclass(slots=True)
+class HNDiscussion:
+    """A trending Hacker News story."""
+
+    id: str
+    title: str
+    url: str
+    points: int
+    comments: int
+    author: str
+    hn_link: str
+    source: str = "Hacker News"
+    category: str = "Dev Discussion"
+
+
+@dataclass(slots=True)
+class GitHubRepo:
+    """A trending GitHub repository."""
+
+    title: str
+    url: str
+    stars: int
+    language: str
+    author: str
+    source: str = "GitHub Trending"
+    category: str = "Open Source"
+
+
+# Default session when callers don't pass their own
+_SESSION = create_session()
+
+# Last fetch_all_trending() result, reused by fetch_all_trending_cached()
+TRENDING_CACHE_FILE = Path("cache") / "trending.json"
+
+
+# Validators and bodies of the most recent responses per request URL, so repeat
+# searches can be sent as conditional GETs and answered with 304 Not Modified
+HTTP_ETAG_CACHE_FILE = Path("cache") / "http_etags.json"
+HTTP_ETAG_CACHE_SIZE = 50
+
+_ETAGS = None
+_ETAGS_LOCK = threading.Lock()
+
+
+def _load_etags() -> Dict:
+    """Load the conditional-GET cache once per process."""
+    global _ETAGS
+    if _ETAGS is None:
+        try:
+            with open(HTTP_ETAG_CACHE_FILE, "r") as f:
+                _ETAGS = json.load(f)
+        except FileNotFoundError:
+            _ETAGS = {}
+        except Exception as e:
+            logger.warning(f"Error reading HTTP cache: {e}, starting fresh")
+            _ETAGS = {}
+    return _ETAGS
+
+
+def _save_etags(etags: Dict):
+    """Write the conditional-GET cache atomically."""
+    try:
+        HTTP_ETAG_CACHE_FILE.parent.mkdir(exist_ok=True)
+        tmp_file = HTTP_ETAG_CACHE_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(etags, f, separators=(",", ":"))
+        os.replace(tmp_file, HTTP_ETAG_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Error saving HTTP cache: {e}")
+
+
+def _get_json(http, url: str, params: Dict, timeout: int = 10) -> Dict:
+    """
+    GET a JSON API, revalidating against the last response for the same URL.
+
+    Sends If-None-Match / If-Modified-Since when a previous response carried
+    an ETag or Last-Modified header; on 304 the cached body is returned.
+
+    Args:
+        http: requests.Session to send with
+        url: Endpoint URL
+        params: Query parameters
+        timeout: Request timeout in seconds
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        requests.HTTPError: On non-2xx/304 responses
+    """
+    key = requests.Request("GET", url, params=params).prepare().url
+
+    with _ETAGS_LOCK:
+        entry = _load_etags().get(key)
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = http.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and entry:
+        logger.debug(f"Not modified, reusing cached body for {key}")
+        return entry["body"]
+
+    response.raise_for_status()
+    data = response.json()
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _ETAGS_LOCK:
+            etags = _load_etags()
+            etags.pop(key, None)
+            etags[key] = {"etag": etag, "last_modified": last_modified, "body": data}
+            while len(etags) > HTTP_ETAG_CACHE_SIZE:
+                del etags[next(iter(etags))]
+            _save_etags(etags)
+
+    return data
+
+
+# Hacker News search terms for AI/ML/Dev related posts
+HN_QUERIES = ["AI", "LLM", "programming", "developer", "coding"]
+
+
+def _fetch_hn_hits(http, query: str, min_points: int) -> List[Dict]:
+    """
+    Run one Algolia search for an HN query.
+
+    Returns:
+        Raw Algolia hits (empty list on error)
+    """
+    try:
+        params = {
+            "query": query,
+            "tags": "story",
+            "numericFilters": f"points>{min_points}",
+            "hitsPerPage": 5,
+        }
+
+        return _get_json(http, HN_ALGOLIA_URL, params).get("hits", [])
+
+    except Exception as e:
+        logger.warning(f"Error fetching HN for query '{query}': {e}")
+        return []
+
+
+def fetch_hn_trending(
+    min_points: int = 50, max_items: int = 5, session: requests.Session = None
+) -> List[HNDiscussion]:
     """
     Fetch trending AI/Dev discussions from Hacker News using Algolia API.
     These are REAL discussions devs are having right now.
 
+    The per-query searches run concurrently and are merged in query order.
+
     Args:
         min_points: Minimum upvotes to consider "trending"
         max_items: Max items to return
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         List of trending HN discussions
     """
+    http = session or _SESSION
     discussions = []
+    seen_ids = set()
 
     # Search for AI/ML/Dev related posts with good engagement
-    queries = ["AI", "LLM", "programming", "developer", "coding"]
-
-    for query in queries:
-        try:
-            params = {
-                "query": query,
-                "tags": "story",
-                "numericFilters": f"points>{min_points}",
-                "hitsPerPage": 5,
-            }
-
-            response = requests.get(HN_ALGOLIA_URL, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            for hit in data.get("hits", []):
-                # Skip if already added
-                if any(d["id"] == hit["objectID"] for d in discussions):
-                    continue
-
-                discussions.append(
-                    {
-                        "id": hit["objectID"],
-                        "title": hit.get("title", ""),
-                        "url": hit.get(
-                            "url",
-                            f"https://news.ycombinator.com/item?id={hit['objectID']}",
-                        ),
-                        "points": hit.get("points", 0),
-                        "comments": hit.get("num_comments", 0),
-                        "author": hit.get("author", ""),
-                        "source": "Hacker News",
-                        "category": "Dev Discussion",
-                        "hn_link": f"https://news.ycombinator.com/item?id={hit['objectID']}",
-                    }
+    with ThreadPoolExecutor(max_workers=len(HN_QUERIES)) as executor:
+        results = list(
+            executor.map(lambda q: _fetch_hn_hits(http, q, min_points), HN_QUERIES)
+        )
+
+    for hits in results:
+        for hit in hits:
+            object_id = hit["objectID"]
+
+            # Skip if already added
+            if object_id in seen_ids:
+                continue
+            seen_ids.add(object_id)
+
+            hn_link = f"https://news.ycombinator.com/item?id={object_id}"
+            discussions.append(
+                HNDiscussion(
+                    id=object_id,
+                    title=hit.get("title") or "",
+                    # Ask/Show HN stories have no external URL
+                    url=hit.get("url") or hn_link,
+                    points=hit.get("points") or 0,
+                    comments=hit.get("num_comments") or 0,
+                    author=hit.get("author") or "",
+                    hn_link=hn_link,
                 )
-
-        except Exception as e:
-            logger.warning(f"Error fetching HN for query '{query}': {e}")
-            continue
+            )
 
     # Sort by points (most upvoted = most discussed)
-    discussions.sort(key=lambda x: x["points"], reverse=True)
+    discussions.sort(key=lambda x: x.points, reverse=True)
     logger.info(f"Found {len(discussions)} trending HN discussions")
 
     return discussions[:max_items]
 
 
-def fetch_github_trending(max_items: int = 3) -> List[Dict]:
+def fetch_github_trending(
+    max_items: int = 3, session: requests.Session = None
+) -> List[GitHubRepo]:
     """
     Fetch trending AI/Dev repositories from GitHub.
 
     Args:
         max_items: Max items to return
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         List of trending repos
     """
+    http = session or _SESSION
     repos = []
 
     # Search for repos created in last 7 days with good stars
@@ -107,21 +284,18 @@ def fetch_github_trending(max_items: int = 3) -> List[Dict]:
             "per_page": max_items,
         }
 
-        response = requests.get(GITHUB_SEARCH_URL, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json(http, GITHUB_SEARCH_URL, params)
 
         for repo in data.get("items", []):
+            description = repo.get("description") or "No description"
             repos.append(
-                {
-                    "title": f"{repo['name']} - {repo.get('description', 'No description')[:100]}",
-                    "url": repo["html_url"],
-                    "stars": repo["stargazers_count"],
-                    "language": repo.get("language", "Unknown"),
-                    "source": "GitHub Trending",
-                    "category": "Open Source",
-                    "author": repo["owner"]["login"],
-                }
+                GitHubRepo(
+                    title=f"{repo['name']} - {description[:100]}",
+                    url=repo["html_url"],
+                    stars=repo["stargazers_count"],
+                    language=repo.get("language") or "Unknown",
+                    author=repo["owner"]["login"],
+                )
             )
 
         logger.info(f"Found {len(repos)} trending GitHub repos")
@@ -132,74 +306,125 @@ def fetch_github_trending(max_items: int = 3) -> List[Dict]:
     return repos
 
 
-def fetch_rss_news(max_age_hours: int = 24, max_items: int = 5) -> List[Dict]:
+def _fetch_feed_news(http, feed_config: Dict, cutoff_time: datetime) -> List[Dict]:
+    """
+    Fetch and parse one RSS feed.
+
+    The feed is downloaded with the pooled session (keep-alive, gzip) and
+    only the parsing is left to feedparser.
+
+    Args:
+        http: requests.Session to download with
+        feed_config: Entry from RSS_FEEDS
+        cutoff_time: Skip articles published before this
+
+    Returns:
+        News items from the feed (empty list on error)
+    """
+    news = []
+
+    try:
+        logger.info(f"Fetching from {feed_config['name']}...")
+        response = http.get(feed_config["url"], timeout=10)
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+
+        for entry in feed.entries[:5]:  # Limit per feed
+            published = None
+            if hasattr(entry, "published_parsed") and entry.published_parsed:
+                published = datetime(*entry.published_parsed[:6])
+            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+                published = datetime(*entry.updated_parsed[:6])
+
+            if published and published < cutoff_time:
+                continue
+
+            summary = ""
+            if hasattr(entry, "summary"):
+                summary = entry.summary[:200]
+            elif hasattr(entry, "description"):
+                summary = entry.description[:200]
+
+            summary = _TAG_RE.sub("", summary).strip()
+
+            news_item = {
+                "title": entry.title,
+                "summary": summary,
+                "link": entry.link,
+                "source": feed_config["name"],
+                "category": feed_config["category"],
+                "published": published.isoformat() if published else None,
+            }
+            news.append(news_item)
+
+    except Exception as e:
+        logger.error(f"Error fetching from {feed_config['name']}: {e}")
+
+    return news
+
+
+def fetch_rss_news(
+    max_age_hours: int = 24, max_items: int = 5, session: requests.Session = None
+) -> List[Dict]:
     """
     Fetch recent news from configured RSS feeds.
 
+    Feeds are fetched concurrently; results are merged and sorted by date.
+
     Args:
         max_age_hours: Only include articles from the last N hours
         max_items: Maximum number of articles to return
+        session: Optional requests.Session to reuse pooled connections
 
     Returns:
         List of news items
     """
+    http = session or _SESSION
     all_news = []
     cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
 
-    for feed_config in RSS_FEEDS:
-        try:
-            logger.info(f"Fetching from {feed_config['name']}...")
-            feed = feedparser.parse(feed_config["url"])
-
-            for entry in feed.entries[:5]:  # Limit per feed
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6])
-                elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                    published = datetime(*entry.updated_parsed[:6])
-
-                if published and published < cutoff_time:
-                    continue
-
-                summary = ""
-                if hasattr(entry, "summary"):
-                    summary = entry.summary[:200]
-                elif hasattr(entry, "description"):
-                    summary = entry.description[:200]
-
-                summary = re.sub(r"<[^>]+>", "", summary).strip()
-
-                news_item = {
-                    "title": entry.title,
-                    "summary": summary,
-                    "link": entry.link,
-                    "source": feed_config["name"],
-                    "category": feed_config["category"],
-                    "published": published.isoformat() if published else None,
-                }
-                all_news.append(news_item)
+    if not RSS_FEEDS:
+        return all_news
 
-        except Exception as e:
-            logger.error(f"Error fetching from {feed_config['name']}: {e}")
-            continue
+    with ThreadPoolExecutor(max_workers=min(8, len(RSS_FEEDS))) as executor:
+        for news in executor.map(
+            lambda feed_config: _fetch_feed_news(http, feed_config, cutoff_time),
+            RSS_FEEDS,
+        ):
+            all_news.extend(news)
 
     all_news.sort(key=lambda x: x["published"] or "", reverse=True)
     return all_news[:max_items]
 
 
-def fetch_all_trending(max_items: int = 10) -> Dict:
+def fetch_all_trending(max_items: int = 10, session: requests.Session = None) -> Dict:
     """
     Fetch ALL trending content: HN discussions, GitHub repos, and RSS news.
     Returns structured data for better tweet generation.
 
+    The three sources are network-bound and independent, so they are fetched
+    concurrently; total latency is the slowest source rather than the sum.
+
+    Args:
+        session: Optional requests.Session shared by all fetchers
+
     Returns:
         Dict with categorized trending content
     """
     logger.info("🔥 Fetching trending dev discussions...")
 
-    hn_discussions = fetch_hn_trending(min_points=30, max_items=5)
-    github_repos = fetch_github_trending(max_items=3)
-    rss_news = fetch_rss_news(max_items=5)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        hn_future = executor.submit(
+            fetch_hn_trending, min_points=30, max_items=5, session=session
+        )
+        gh_future = executor.submit(
+            fetch_github_trending, max_items=3, session=session
+        )
+        rss_future = executor.submit(fetch_rss_news, max_items=5, session=session)
+
+        hn_discussions = hn_future.result()
+        github_repos = gh_future.result()
+        rss_news = rss_future.result()
 
     return {
         "hn_discussions": hn_discussions,
@@ -210,6 +435,72 @@ def fetch_all_trending(max_items: int = 10) -> Dict:
     }
 
 
+def _trending_to_json(trending: Dict) -> Dict:
+    """Convert fetch_all_trending() output to plain JSON types."""
+    return {
+        "hn_discussions": [asdict(d) for d in trending["hn_discussions"]],
+        "github_repos": [asdict(r) for r in trending["github_repos"]],
+        "news": trending["news"],
+    }
+
+
+def _trending_from_json(data: Dict) -> Dict:
+    """Rebuild fetch_all_trending() output from _trending_to_json() data."""
+    hn_discussions = [HNDiscussion(**d) for d in data["hn_discussions"]]
+    github_repos = [GitHubRepo(**r) for r in data["github_repos"]]
+    return {
+        "hn_discussions": hn_discussions,
+        "github_repos": github_repos,
+        "news": data["news"],
+        "top_discussion": hn_discussions[0] if hn_discussions else None,
+        "top_repo": github_repos[0] if github_repos else None,
+    }
+
+
+def fetch_all_trending_cached(
+    ttl_seconds: int = TRENDING_CACHE_TTL, session: requests.Session = None
+) -> Dict:
+    """
+    fetch_all_trending() with a disk-backed TTL cache.
+
+    Trends barely move within a few hours, so scheduled runs close together
+    share one fetch. Freshness is judged by the cache file's mtime, which
+    also makes the cache shared across processes (e.g. CI runs).
+
+    Args:
+        ttl_seconds: Max age of cached data to reuse (0 always fetches)
+        session: Optional requests.Session passed through on a miss
+
+    Returns:
+        Dict with categorized trending content
+    """
+    try:
+        age = time.time() - TRENDING_CACHE_FILE.stat().st_mtime
+        if age < ttl_seconds:
+            with open(TRENDING_CACHE_FILE, "r") as f:
+                trending = _trending_from_json(json.load(f))
+            logger.info(f"📂 Using cached trending data ({int(age // 60)} min old)")
+            return trending
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Error reading trending cache: {e}, fetching fresh")
+
+    trending = fetch_all_trending(session=session)
+
+    try:
+        TRENDING_CACHE_FILE.parent.mkdir(exist_ok=True)
+        # Swap in a finished file so concurrent readers never see partial JSON
+        tmp_file = TRENDING_CACHE_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(_trending_to_json(trending), f, separators=(",", ":"))
+        os.replace(tmp_file, TRENDING_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Error saving trending cache: {e}")
+
+    return trending
+
+
 def get_headlines(news_items: List[Dict]) -> List[str]:
     """Extract just the headlines from news items."""
     return [item["title"] for item in news_items]
@@ -225,11 +516,11 @@ if __name__ == "__main__":
 
     print("📢 Hacker News Hot Topics:")
     for d in trending["hn_discussions"]:
-        print(f"  • {d['title'][:60]}... ({d['points']} pts, {d['comments']} comments)")
+        print(f"  • {d.title[:60]}... ({d.points} pts, {d.comments} comments)")
 
     print("\n⭐ GitHub Trending Repos:")
     for r in trending["github_repos"]:
-        print(f"  • {r['title'][:60]}... ({r['stars']} stars)")
+        print(f"  • {r.title[:60]}... ({r.stars} stars)")
 
     print("\n📰 Latest News:")
     for n in trending["news"][:3]:
@@ -4,11 +4,20 @@ Posts tweets to X (Twitter) using API v2 via Tweepy
 Includes duplicate detection using local cache
 """
 
+import atexit
+import functools
 import hashlib
-import json
 import logging
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import tweepy
+from typing import TYPE_CHECKING, List
 
 from config.settings import (
     X_API_KEY,
@@ -17,44 +26,356 @@ from config.settings import (
     X_ACCESS_TOKEN_SECRET,
     DRY_RUN,
 )
+from modules import jsonl_log
+
+if TYPE_CHECKING:
+    import tweepy
 
 logger = logging.getLogger(__name__)
 
-# Cache file for storing recent tweet hashes (prevents duplicates)
-CACHE_FILE = Path(__file__).parent.parent / "tweet_history.json"
+# Settings are read once at import, so this can't change at runtime
+_CREDENTIALS_OK = all([X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET])
+
+# Cache file for storing recent tweet hashes (prevents duplicates).
+# Append-only JSON Lines, one hash per line; compacted to the last
+# MAX_HISTORY hashes once it reaches twice that many lines
+CACHE_FILE = Path(__file__).parent.parent / "tweet_history.jsonl"
+LEGACY_CACHE_FILE = CACHE_FILE.with_suffix(".json")  # Pre-JSONL list, migrated on load
 MAX_HISTORY = 10
 
+# Bloom filter over every hash ever posted, so a tweet is never reposted,
+# even long after it left the MAX_HISTORY window. It is made of ~18 KB
+# layers holding BLOOM_CAPACITY posts each; a new layer starts when the
+# current one is full, and each full layer adds about BLOOM_ERROR_RATE to
+# the chance of wrongly rejecting a new tweet. The file is only rewritten
+# on compaction; hashes appended since are re-added from the log on load.
+BLOOM_FILE = CACHE_FILE.with_suffix(".bloom")
+BLOOM_CAPACITY = 10_000
+BLOOM_ERROR_RATE = 0.001
+BLOOM_BITS = math.ceil(-BLOOM_CAPACITY * math.log(BLOOM_ERROR_RATE) / math.log(2) ** 2)
+BLOOM_HASHES = round(BLOOM_BITS / BLOOM_CAPACITY * math.log(2))
+BLOOM_LAYER_BYTES = (BLOOM_BITS + 7) // 8
+
+# Last successful verify_credentials() result and when it goes stale (monotonic)
+VERIFY_CACHE_TTL = 300
+_VERIFY_CACHE = {"expires": 0.0, "value": None}
+
+# Public link to a posted tweet
+TWEET_URL = "https://x.com/i/web/status/{tweet_id}"
+
+# Last loaded/saved history, reused until the file's mtime or size changes
+_HISTORY_CACHE = {"mtime": 0, "size": 0, "data": None}
+
+# Guards history load/check/record/save steps across threads (re-entrant,
+# since recording loads history while holding it). Never held across an API
+# call: posts reserve their hash in _IN_FLIGHT instead
+_HISTORY_LOCK = threading.RLock()
+# Hashes of posts awaiting the API; other callers treat them as duplicates
+_IN_FLIGHT = set()
+
+# Async client and the event loop it belongs to: its aiohttp session only
+# works on the loop it was created on
+_ASYNC_CLIENT = {"loop": None, "client": None}
+
+# History writes happen off the posting path; one worker keeps them in order
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="x-cache")
+atexit.register(_IO_EXECUTOR.shutdown, wait=True)
+
+# Whitespace runs collapsed to one space before hashing
+_WS_RE = re.compile(r"\s+")
+
+# X's weighted length rules (twitter-text v3): code points in these ranges
+# weigh 1, everything else (CJK, emoji, ...) weighs 2, an emoji sequence
+# weighs 2 however many code points it has, and every URL counts as one
+# t.co link
+MAX_TWEET_WEIGHT = 280
+URL_WEIGHT = 23
+EMOJI_WEIGHT = 2
+_LIGHT_RANGES = ((0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037))
+# Trailing punctuation isn't part of a link ("see https://example.com.")
+_URL_END = r"[^\s.,:;!?'\")\]]"
+_URL_PATH = rf"/(?:\S*{_URL_END})?"
+_URL_RE = re.compile(rf"https?://\S*{_URL_END}")
+# Links without a scheme, as X autolinks them: a common generic TLD, or a
+# country-code TLD followed by a path (except .co/.tv, linked bare)
+_BARE_URL_RE = re.compile(
+    r"(?<![\w@.-])(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+"
+    r"(?:(?:com|net|org|edu|gov|info|biz|dev|app|xyz|tech|news|blog|co|tv)"
+    rf"(?!\.?[\w-])(?:{_URL_PATH})?|[a-z]{{2}}{_URL_PATH})",
+    re.IGNORECASE,
+)
+# Multi-code-point emoji that aren't joined by ZWJ: keycaps (1️⃣) and flags,
+# which are pairs of regional indicator letters (🇺🇸)
+_EMOJI_SEQ_RE = re.compile("[0-9#*]\ufe0f?\u20e3|[\U0001f1e6-\U0001f1ff]{2}")
+# Emoji a ZWJ can join onto (symbols, dingbats and the emoji planes); a ZWJ
+# elsewhere (e.g. in Devanagari) is an ordinary character
+_EMOJI_BASE = re.compile(
+    "[\u2300-\u23ff\u2600-\u27bf\u2b00-\u2bff\U0001f000-\U0001faff]"
+)
+# Joiners, variation selectors, skin tones and tag characters don't add
+# weight inside an emoji sequence
+_EMOJI_MODIFIERS = re.compile(
+    "[\u200d\ufe00-\ufe0f\u20e3\U0001f3fb-\U0001f3ff\U000e0020-\U000e007f]"
+)
+
 
 def _get_tweet_hash(text: str) -> str:
     """Generate a hash of tweet content for duplicate detection."""
-    # Normalize: lowercase, remove extra spaces
-    normalized = " ".join(text.lower().split())
-    return hashlib.md5(normalized.encode()).hexdigest()[:16]
+    # Normalize: casefold, collapse whitespace
+    normalized = _WS_RE.sub(" ", text).strip().casefold()
+    # 64-bit BLAKE2b: same 16 hex chars as the old truncated MD5, without the truncation
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
 
 
-def _load_history() -> list:
-    """Load tweet history from cache file."""
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
-    return []
+def _bloom_positions(tweet_hash: str):
+    """Yield the filter's bit positions for a hash (double hashing)."""
+    # The tweet hash is already a uniform 64-bit digest; split it instead of rehashing
+    value = int(tweet_hash, 16)
+    h1, h2 = value >> 32, value & 0xFFFFFFFF | 1
+    for i in range(BLOOM_HASHES):
+        yield (h1 + i * h2) % BLOOM_BITS
+
+
+def _bloom_add(bloom: bytearray, tweet_hash: str):
+    for pos in _bloom_positions(tweet_hash):
+        bloom[pos >> 3] |= 1 << (pos & 7)
+
+
+def _bloom_contains(bloom: bytearray, tweet_hash: str) -> bool:
+    return all(bloom[pos >> 3] & 1 << (pos & 7) for pos in _bloom_positions(tweet_hash))
+
 
+def _bloom_count(layer: bytearray) -> int:
+    """Estimate how many hashes a layer holds from its set bits."""
+    set_bits = int.from_bytes(layer, "little").bit_count()
+    if set_bits >= BLOOM_BITS:
+        return BLOOM_CAPACITY
+    return round(-BLOOM_BITS / BLOOM_HASHES * math.log(1 - set_bits / BLOOM_BITS))
 
-def _save_history(history: list):
-    """Save tweet history to cache file."""
+
+def _load_bloom():
+    """Read the persisted filter layers, or None if missing or sized differently."""
     try:
-        with open(CACHE_FILE, "w") as f:
-            json.dump(history[-MAX_HISTORY:], f)
-    except IOError as e:
-        logger.warning(f"Could not save tweet history: {e}")
+        data = BLOOM_FILE.read_bytes()
+    except IOError:
+        return None
+    if not data or len(data) % BLOOM_LAYER_BYTES:
+        return None
+    return [
+        bytearray(data[i : i + BLOOM_LAYER_BYTES])
+        for i in range(0, len(data), BLOOM_LAYER_BYTES)
+    ]
+
+
+def _tweet_weight(text: str) -> int:
+    """
+    Weighted tweet length, as X counts it against the 280 limit.
+
+    Args:
+        text: Tweet content
+
+    Returns:
+        Weighted length (ASCII/Latin text weighs its length)
+    """
+    text = unicodedata.normalize("NFC", text)
+    text, urls = _URL_RE.subn("", text)
+    text, bare_urls = _BARE_URL_RE.subn("", text)
+    text, emoji = _EMOJI_SEQ_RE.subn("", text)
+    weight = (urls + bare_urls) * URL_WEIGHT + emoji * EMOJI_WEIGHT
+
+    after_emoji = after_zwj = False
+    for char in text:
+        joiner = char == "\u200d"
+        if _EMOJI_MODIFIERS.match(char) and (after_emoji or not joiner):
+            # A joined emoji (e.g. a family) counts once, like X does
+            after_zwj = joiner
+            continue
+        if after_zwj:
+            after_zwj = False
+            continue
+        after_emoji = bool(_EMOJI_BASE.match(char))
+        cp = ord(char)
+        weight += 1 if any(lo <= cp <= hi for lo, hi in _LIGHT_RANGES) else EMOJI_WEIGHT
+
+    return weight
+
+
+def _new_history(hashes=(), bloom: list = None) -> dict:
+    """
+    Build an in-memory history from hashes, oldest first.
+
+    Args:
+        hashes: Logged tweet hashes, oldest first; the last MAX_HISTORY
+            become the recent views and all of them go into the filter
+        bloom: Filter layers of all past hashes; a new one is started if omitted
+
+    Returns:
+        Dict with 'order' (FIFO deque bounded to MAX_HISTORY), 'set'
+        (the same hashes, for O(1) membership tests), 'bloom' (filter
+        layers, newest last) and 'bloom_count' (hashes in the newest layer)
+    """
+    order = deque(hashes, maxlen=MAX_HISTORY)
+    if bloom is None:
+        bloom = [bytearray(BLOOM_LAYER_BYTES)]
+    history = {
+        "order": order,
+        "set": set(order),
+        "bloom": bloom,
+        "bloom_count": _bloom_count(bloom[-1]),
+        "lines": len(order),
+    }
+    for tweet_hash in hashes:
+        _add_to_bloom(history, tweet_hash)
+    return history
+
+
+def _add_to_bloom(history: dict, tweet_hash: str):
+    """Add a hash to the newest filter layer, starting a new layer once it's full."""
+    if any(_bloom_contains(layer, tweet_hash) for layer in history["bloom"]):
+        return
+    layer = history["bloom"][-1]
+    if history["bloom_count"] >= BLOOM_CAPACITY:
+        layer = bytearray(BLOOM_LAYER_BYTES)
+        history["bloom"].append(layer)
+        history["bloom_count"] = 0
+    _bloom_add(layer, tweet_hash)
+    history["bloom_count"] += 1
+
+
+def _add_to_history(history: dict, tweet_hash: str):
+    """Append a hash, evicting the oldest one from the recent views when full."""
+    order = history["order"]
+    if len(order) == order.maxlen:
+        history["set"].discard(order.popleft())
+    order.append(tweet_hash)
+    history["set"].add(tweet_hash)
+    _add_to_bloom(history, tweet_hash)
+
+
+def _remember_history(history: dict):
+    """Memoize history against the file state it was read from or written to."""
+    stat = CACHE_FILE.stat()
+    _HISTORY_CACHE.update(mtime=stat.st_mtime_ns, size=stat.st_size, data=history)
+
+
+def _load_history() -> dict:
+    """
+    Load tweet history from cache file.
+
+    The parsed history is memoized; while the file's mtime and size are
+    unchanged the cost is one stat() call instead of a read and parse.
+
+    Returns:
+        History dict from _new_history()
+    """
+    with _HISTORY_LOCK:
+        try:
+            stat = CACHE_FILE.stat()
+            mtime, size = stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            mtime = size = None
+            if LEGACY_CACHE_FILE.exists() and jsonl_log.migrate_legacy(
+                LEGACY_CACHE_FILE, CACHE_FILE, list
+            ):
+                stat = CACHE_FILE.stat()
+                mtime, size = stat.st_mtime_ns, stat.st_size
+            # Otherwise nothing is saved yet (or a save is still queued);
+            # memoize the empty history too so posts made meanwhile land in
+            # the same object
+
+        if (
+            _HISTORY_CACHE["data"] is not None
+            and _HISTORY_CACHE["mtime"] == mtime
+            and _HISTORY_CACHE["size"] == size
+        ):
+            return _HISTORY_CACHE["data"]
+
+        if mtime is None:
+            history = _new_history(bloom=_load_bloom())
+            _HISTORY_CACHE.update(mtime=None, size=None, data=history)
+            return history
+
+        try:
+            # The whole log: hashes appended since the last compaction
+            # aren't in the persisted filter yet
+            hashes, line_count = jsonl_log.read_tail(CACHE_FILE, None)
+        except OSError:
+            return _new_history(bloom=_load_bloom())
+
+        history = _new_history(hashes, _load_bloom())
+        history["lines"] = line_count
+        _remember_history(history)
+        return history
+
+
+def _save_history(history: dict, hashes: list = None):
+    """
+    Rewrite (compact) tweet history to the cache file, and persist the filter.
+
+    Posts only append (see _append_history); this full rewrite runs when the
+    log has grown to twice MAX_HISTORY lines.
+
+    Args:
+        history: History dict to save (and memoize)
+        hashes: Snapshot of history["order"] to write; taken now if omitted.
+            Pass it when saving from another thread.
+    """
+    with _HISTORY_LOCK:
+        if hashes is None:
+            hashes = list(history["order"])
+        # The filter only ever gains hashes, so the current one covers the snapshot
+        bloom = b"".join(history["bloom"])
+
+        try:
+            # The filter goes first: if the log rewrite is lost, the old log
+            # still re-adds its hashes on load. Write a sibling file and swap
+            # it in, so a crash can't leave torn data
+            tmp_bloom = BLOOM_FILE.with_suffix(".bloom.tmp")
+            tmp_bloom.write_bytes(bloom)
+            os.replace(tmp_bloom, BLOOM_FILE)
+
+            history["lines"] = jsonl_log.rewrite(CACHE_FILE, hashes)
+            _remember_history(history)
+        except IOError as e:
+            logger.warning("Could not save tweet history: %s", e)
+
+
+def _append_history(history: dict, new_hashes: list, hashes: list):
+    """
+    Append newly posted hashes to the log, compacting it once it gets too long.
+
+    Args:
+        history: History dict the hashes were already added to
+        new_hashes: Hashes to append
+        hashes: Snapshot of history["order"], for compaction
+    """
+    with _HISTORY_LOCK:
+        try:
+            history["lines"] += jsonl_log.append(CACHE_FILE, new_hashes)
+            _remember_history(history)
+        except IOError as e:
+            logger.warning("Could not save tweet history: %s", e)
+            return
+
+        if jsonl_log.needs_compaction(history["lines"], MAX_HISTORY):
+            _save_history(history, hashes)
+
+
+def _queue_history_save(history: dict, new_hashes: list):
+    """Append to history on the background writer, from a snapshot taken now."""
+    _IO_EXECUTOR.submit(
+        _append_history,
+        history,
+        list(new_hashes),
+        list(history["order"]),
+    )
 
 
 def is_duplicate(text: str) -> bool:
     """
-    Check if a tweet is a duplicate of recent tweets.
+    Check if a tweet was posted before.
+
+    See is_duplicate_hash() for what counts as posted before.
 
     Args:
         text: Tweet content to check
@@ -62,19 +383,40 @@ def is_duplicate(text: str) -> bool:
     Returns:
         True if duplicate, False otherwise
     """
-    tweet_hash = _get_tweet_hash(text)
-    history = _load_history()
-    return tweet_hash in history
+    return is_duplicate_hash(_get_tweet_hash(text))
 
 
-def get_client() -> tweepy.Client:
+def is_duplicate_hash(tweet_hash: str, history: dict = None) -> bool:
     """
-    Create and return an authenticated Tweepy Client for X API v2.
+    Check an already computed tweet hash against every past post.
+
+    The last MAX_HISTORY posts are checked exactly; older ones through the
+    Bloom filter, so a tweet is rejected no matter how long ago it was
+    posted. The filter can wrongly reject a tweet that was never posted,
+    with a chance of about BLOOM_ERROR_RATE per BLOOM_CAPACITY posts.
+
+    Args:
+        tweet_hash: Output of _get_tweet_hash()
+        history: Optional history dict (will load if not provided)
 
     Returns:
-        Authenticated tweepy.Client instance
+        True if duplicate, False otherwise
     """
-    if not all([X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET]):
+    if history is None:
+        history = _load_history()
+    return tweet_hash in history["set"] or any(
+        _bloom_contains(layer, tweet_hash) for layer in history["bloom"]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_client() -> "tweepy.Client":
+    """Build the Tweepy Client once; later calls reuse its pooled session."""
+    # Imported here: tweepy pulls in requests/oauthlib, which dry runs and
+    # duplicate checks never need
+    import tweepy
+
+    if not _CREDENTIALS_OK:
         raise ValueError("X API credentials are not fully configured")
 
     client = tweepy.Client(
@@ -87,6 +429,173 @@ def get_client() -> tweepy.Client:
     return client
 
 
+def get_client() -> "tweepy.Client":
+    """
+    Return the shared authenticated Tweepy Client for X API v2.
+
+    Credentials are fixed for the life of the process, so the client (and
+    its keep-alive connection) is created on first use and then reused.
+
+    Returns:
+        Authenticated tweepy.Client instance
+    """
+    return _cached_client()
+
+
+def reset_client():
+    """Drop the shared clients and cached credential check."""
+    _cached_client.cache_clear()
+    _ASYNC_CLIENT.update(loop=None, client=None)
+    _VERIFY_CACHE.update(expires=0.0, value=None)
+
+
+def _cached_async_client():
+    """
+    Return the asyncio Tweepy client for the running event loop.
+
+    Needs the tweepy[async] extra (aiohttp). Its HTTP session is bound to the
+    loop it was created on, so a new client is built whenever the running
+    loop changes (e.g. on each asyncio.run()) and reused within a loop.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT["loop"] is not loop:
+        from tweepy.asynchronous import AsyncClient
+
+        if not _CREDENTIALS_OK:
+            raise ValueError("X API credentials are not fully configured")
+
+        client = AsyncClient(
+            consumer_key=X_API_KEY,
+            consumer_secret=X_API_SECRET,
+            access_token=X_ACCESS_TOKEN,
+            access_token_secret=X_ACCESS_TOKEN_SECRET,
+        )
+        _ASYNC_CLIENT.update(loop=loop, client=client)
+    return _ASYNC_CLIENT["client"]
+
+
+def _validate_tweet(text: str):
+    """
+    Reject tweets the API would refuse, before any request is made.
+
+    Args:
+        text: The tweet content
+
+    Raises:
+        ValueError: If the tweet is empty or over MAX_TWEET_WEIGHT
+    """
+    # Validate weighted length locally rather than paying for an API rejection
+    weight = _tweet_weight(text)
+    if weight > MAX_TWEET_WEIGHT:
+        raise ValueError(
+            f"Tweet exceeds {MAX_TWEET_WEIGHT} weighted characters: {weight}"
+        )
+    if not text.strip():
+        raise ValueError("Tweet is empty")
+
+
+def _check_tweet(text: str, dry_run: bool) -> tuple:
+    """
+    Validate a tweet and check it against history before posting.
+
+    Args:
+        text: The tweet content
+        dry_run: Resolved dry-run flag
+
+    Returns:
+        (tweet_hash, result) where result is the duplicate/dry-run response
+        to return instead of posting, or None if the tweet should be posted
+    """
+    # Cheap checks first, before hashing and history I/O
+    _validate_tweet(text)
+
+    # Check for duplicates; the hash is reused for the history append
+    tweet_hash = _get_tweet_hash(text)
+    if tweet_hash in _IN_FLIGHT or is_duplicate_hash(tweet_hash):
+        logger.warning("⚠️ Duplicate tweet detected, skipping...")
+        return tweet_hash, {"duplicate": True, "text": text}
+
+    if dry_run:
+        logger.info("[DRY RUN] Would post tweet (%d chars):\n%s", len(text), text)
+        return tweet_hash, {"dry_run": True, "text": text, "length": len(text)}
+
+    return tweet_hash, None
+
+
+def _record_post(text: str, tweet_hash: str, tweet_id, save: bool = True) -> dict:
+    """
+    Log a successful post and add it to history.
+
+    Args:
+        text: The posted tweet content
+        tweet_hash: Output of _get_tweet_hash(text)
+        tweet_id: ID returned by the API
+        save: Queue a history write; batch callers write once at the end
+
+    Returns:
+        Response dict with tweet info
+    """
+    url = TWEET_URL.format(tweet_id=tweet_id)
+    logger.info("✅ Tweet posted successfully! ID: %s", tweet_id)
+    logger.info("   View at: %s", url)
+
+    # Save to history after successful post
+    history = _load_history()
+    _add_to_history(history, tweet_hash)
+    if save:
+        _queue_history_save(history, [tweet_hash])
+
+    return {
+        "success": True,
+        "tweet_id": tweet_id,
+        "text": text,
+        "url": url,
+    }
+
+
+def _reserve_post(text: str, dry_run: bool) -> tuple:
+    """
+    Check a tweet and, if it should be posted, mark its hash as in flight.
+
+    Args:
+        text: The tweet content
+        dry_run: Resolved dry-run flag
+
+    Returns:
+        Same as _check_tweet(); the hash is reserved only when result is None
+    """
+    with _HISTORY_LOCK:
+        tweet_hash, result = _check_tweet(text, dry_run)
+        if result is None:
+            _IN_FLIGHT.add(tweet_hash)
+        return tweet_hash, result
+
+
+def _finish_post(text: str, tweet_hash: str, response, save: bool = True):
+    """
+    Release a reserved hash, recording the post if the API call succeeded.
+
+    Both happen in one locked step, so other callers never see the tweet as
+    neither in flight nor posted.
+
+    Args:
+        text: The tweet content
+        tweet_hash: Hash reserved by _reserve_post()
+        response: API response, or None if the call failed
+        save: Passed on to _record_post()
+
+    Returns:
+        _record_post() result, or None if nothing was posted
+    """
+    with _HISTORY_LOCK:
+        _IN_FLIGHT.discard(tweet_hash)
+        if response is None:
+            return None
+        return _record_post(text, tweet_hash, response.data["id"], save=save)
+
+
 def post_tweet(text: str, dry_run: bool = None) -> dict:
     """
     Post a tweet to X.
@@ -98,69 +607,219 @@ def post_tweet(text: str, dry_run: bool = None) -> dict:
     Returns:
         Response dict with tweet info or dry_run status
     """
-    if dry_run is None:
-        dry_run = DRY_RUN
-
-    # Validate tweet length
-    if len(text) > 280:
-        raise ValueError(f"Tweet exceeds 280 characters: {len(text)}")
+    dry_run = DRY_RUN if dry_run is None else dry_run
 
-    # Check for duplicates
-    if is_duplicate(text):
-        logger.warning("⚠️ Duplicate tweet detected, skipping...")
-        return {"duplicate": True, "text": text}
+    tweet_hash, result = _reserve_post(text, dry_run)
+    if result is not None:
+        return result
 
-    if dry_run:
-        logger.info(f"[DRY RUN] Would post tweet ({len(text)} chars):\n{text}")
-        return {"dry_run": True, "text": text, "length": len(text)}
+    import tweepy
 
+    response = None
     try:
-        client = get_client()
+        client = _cached_client()
 
         response = client.create_tweet(text=text)
 
-        tweet_id = response.data["id"]
-        logger.info(f"✅ Tweet posted successfully! ID: {tweet_id}")
-        logger.info(f"   View at: https://x.com/i/web/status/{tweet_id}")
+    except tweepy.TweepyException as e:
+        logger.error("❌ Error posting tweet: %s", e)
+        raise
+
+    finally:
+        result = _finish_post(text, tweet_hash, response)
 
-        # Save to history after successful post
-        history = _load_history()
-        history.append(_get_tweet_hash(text))
-        _save_history(history)
+    return result
+
+
+def post_tweets(texts: List[str], dry_run: bool = None) -> List[dict]:
+    """
+    Post several tweets in order, sharing one client and one history write.
 
-        return {
-            "success": True,
-            "tweet_id": tweet_id,
-            "text": text,
-            "url": f"https://x.com/i/web/status/{tweet_id}",
-        }
+    Every text is validated before the first one is posted, so an invalid
+    text fails the batch without posting any of it. An API error, connection
+    failure or timeout only fails its own tweet: it gets an error result and
+    the rest are still posted.
+
+    Args:
+        texts: Tweet contents
+        dry_run: If True, log but don't actually post. Defaults to config setting.
+
+    Returns:
+        Response dicts in the same order as texts; failed posts are
+        {"success": False, "error": ..., "text": ...}
+
+    Raises:
+        ValueError: If any text is empty or too long (nothing is posted)
+    """
+    dry_run = DRY_RUN if dry_run is None else dry_run
+
+    for text in texts:
+        _validate_tweet(text)
+
+    client = None
+    results = []
+    posted = []
+
+    try:
+        for text in texts:
+            tweet_hash, result = _reserve_post(text, dry_run)
+            if result is None:
+                import requests
+                import tweepy
+
+                response = error = None
+                try:
+                    if client is None:
+                        client = _cached_client()
+
+                    response = client.create_tweet(text=text)
+                # requests' network errors reach us unwrapped by tweepy
+                except (
+                    tweepy.TweepyException,
+                    requests.ConnectionError,
+                    requests.Timeout,
+                ) as e:
+                    logger.error("❌ Error posting tweet: %s", e)
+                    error = e
+                finally:
+                    result = _finish_post(text, tweet_hash, response, save=False)
+
+                if result is None:
+                    result = {"success": False, "error": str(error), "text": text}
+                else:
+                    posted.append(tweet_hash)
+
+            results.append(result)
+    finally:
+        # Keep what was posted before a failure in history
+        if posted:
+            with _HISTORY_LOCK:
+                _queue_history_save(_load_history(), posted)
+
+    return results
+
+
+async def post_tweet_async(text: str, dry_run: bool = None) -> dict:
+    """
+    Post a tweet to X without blocking the event loop.
+
+    Same checks and result as post_tweet(); only the API call is awaited.
+
+    Args:
+        text: The tweet content (max 280 characters)
+        dry_run: If True, log but don't actually post. Defaults to config setting.
+
+    Returns:
+        Response dict with tweet info or dry_run status
+    """
+    dry_run = DRY_RUN if dry_run is None else dry_run
+
+    tweet_hash, result = _reserve_post(text, dry_run)
+    if result is not None:
+        return result
+
+    import tweepy
+
+    response = None
+    try:
+        client = _cached_async_client()
+
+        response = await client.create_tweet(text=text)
 
     except tweepy.TweepyException as e:
-        logger.error(f"❌ Error posting tweet: {e}")
+        logger.error("❌ Error posting tweet: %s", e)
         raise
 
+    finally:
+        result = _finish_post(text, tweet_hash, response)
+
+    return result
+
+
+async def post_tweets_async(texts: List[str], dry_run: bool = None) -> List[dict]:
+    """
+    Post several tweets concurrently.
+
+    Repeats within the batch are reported as duplicates rather than racing
+    each other past the history check. Like post_tweets(), every text is
+    validated before any is posted, and a failed post only fails its own
+    tweet, so the others still finish and reach history.
+
+    Args:
+        texts: Tweet contents
+        dry_run: If True, log but don't actually post. Defaults to config setting.
+
+    Returns:
+        Response dicts in the same order as texts; failed posts are
+        {"success": False, "error": ..., "text": ...}
+
+    Raises:
+        ValueError: If any text is empty or too long (nothing is posted)
+    """
+    import asyncio
+
+    for text in texts:
+        _validate_tweet(text)
+
+    seen = set()
+
+    async def _post(text: str) -> dict:
+        tweet_hash = _get_tweet_hash(text)
+        if tweet_hash in seen:
+            logger.warning("⚠️ Duplicate tweet detected, skipping...")
+            return {"duplicate": True, "text": text}
+        seen.add(tweet_hash)
+        return await post_tweet_async(text, dry_run=dry_run)
+
+    results = await asyncio.gather(
+        *(_post(text) for text in texts), return_exceptions=True
+    )
+    for i, (text, result) in enumerate(zip(texts, results)):
+        if isinstance(result, Exception):
+            results[i] = {"success": False, "error": str(result), "text": text}
+        elif isinstance(result, BaseException):
+            raise result
+    return results
+
 
 def verify_credentials() -> dict:
     """
     Verify X API credentials by fetching authenticated user info.
 
+    A successful result is reused for VERIFY_CACHE_TTL seconds, so repeated
+    health checks don't each cost a get_me() round-trip. Failures aren't cached.
+
     Returns:
         User info dict if successful
     """
+    if time.monotonic() < _VERIFY_CACHE["expires"]:
+        logger.debug(
+            "Reusing credential check for @%s", _VERIFY_CACHE["value"]["username"]
+        )
+        return dict(_VERIFY_CACHE["value"])
+
     try:
-        client = get_client()
+        client = _cached_client()
 
         # Get authenticated user
         user = client.get_me()
 
         if user.data:
-            logger.info(f"✅ Authenticated as: @{user.data.username}")
-            return {"success": True, "username": user.data.username, "id": user.data.id}
+            logger.info("✅ Authenticated as: @%s", user.data.username)
+            value = {
+                "success": True,
+                "username": user.data.username,
+                "id": user.data.id,
+            }
+            _VERIFY_CACHE.update(
+                expires=time.monotonic() + VERIFY_CACHE_TTL, value=value
+            )
+            return dict(value)
         else:
             raise ValueError("Could not fetch user info")
 
     except Exception as e:
-        logger.error(f"❌ Credential verification failed: {e}")
+        logger.error("❌ Credential verification failed: %s", e)
         raise
 
 
@@ -168,6 +827,27 @@ if __name__ == "__main__":
     # Test the X poster
     logging.basicConfig(level=logging.INFO)
 
+    # Weighted length: each emoji sequence weighs 2, each link 23
+    print("\n📏 Checking weighted lengths...\n")
+    for sample, expected in (
+        ("🇺🇸", 2),
+        ("🇺🇸🇯🇵", 4),
+        ("1️⃣", 2),
+        ("#\u20e3", 2),
+        ("👨‍👩‍👧", 2),
+        ("see example.com", 27),
+        ("foo.io/path", 23),
+        ("see github.com/foo/bar.", 28),
+        ("https://example.com/a", 23),
+        ("see https://example.com.", 28),
+        ("वाक्\u200dय", 6),
+        ("❤️\u200d🔥", 2),
+        ("node.js and me@example.com", 26),
+    ):
+        weight = _tweet_weight(sample)
+        mark = "✅" if weight == expected else "❌"
+        print(f"{mark} {sample!r}: {weight} (expected {expected})")
+
     print("\n🔐 Verifying X API credentials...\n")
     try:
         user = verify_credentials()